@@ -5,6 +5,7 @@ import platform
 import subprocess
 import shutil
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Tuple
@@ -24,8 +25,12 @@ from PySide6.QtWidgets import (
 
 # ---------------- Parsing / writing ----------------
 
-STREAM_RE = re.compile(r'^\s*stream_data\[(\d+)\]\s*:\s*"(.*)"\s*$')
-STREAM_COUNT_RE = re.compile(r'^(\s*stream_data\s*:\s*)(\d+)(\s*)$')
+# One pass recognizes both 'stream_data[i]: "..."' entries and the 'stream_data: N' count line.
+STREAM_LINE_RE = re.compile(
+    rb'^\s*(?:stream_data\[(\d+)\]\s*:\s*"(.*)"|stream_data\s*:\s*(\d+))\s*\r?\n?$',
+    re.ASCII
+)
+STREAM_COUNT_RE = re.compile(rb'^(\s*stream_data\s*:\s*)(\d+)(\s*)$', re.ASCII)
 
 
 @dataclass
@@ -38,6 +43,7 @@ class Station:
     favorite: bool
 
 
+@lru_cache(maxsize=None)
 def resource_path(relative_name: str) -> str:
     """Works in dev + PyInstaller (Windows/macOS)."""
     if hasattr(sys, "_MEIPASS"):
@@ -45,8 +51,9 @@ def resource_path(relative_name: str) -> str:
     return str(Path(__file__).resolve().parent / relative_name)
 
 
-def _candidate_documents_dirs() -> list[Path]:
-    """Cross-platform Documents discovery via Qt + common fallbacks."""
+@lru_cache(maxsize=1)
+def _candidate_documents_dirs() -> tuple[Path, ...]:
+    """Cross-platform Documents discovery via Qt + common fallbacks (resolved once per process)."""
     cands: list[Path] = []
     try:
         qt_docs = QStandardPaths.writableLocation(QStandardPaths.DocumentsLocation)
@@ -70,14 +77,38 @@ def _candidate_documents_dirs() -> list[Path]:
         if key not in seen:
             seen.add(key)
             out.append(p)
-    return out
+    return tuple(out)
+
+
+def _find_game_dir(docs: Path, game_folder_name: str) -> Optional[Path]:
+    """Locate <docs>/<game folder> with a single directory read (case-insensitive name match)."""
+    want = game_folder_name.lower()
+    try:
+        with os.scandir(str(docs)) as it:
+            for entry in it:
+                if entry.name.lower() != want:
+                    continue
+                try:
+                    if entry.is_dir():
+                        return Path(entry.path)
+                except OSError:
+                    pass
+    except OSError:
+        pass
+    return None
 
 
 def find_game_file(game_folder_name: str) -> Optional[Path]:
     for docs in _candidate_documents_dirs():
-        p = docs / game_folder_name / "live_streams.sii"
-        if p.exists():
-            return p
+        game_dir = _find_game_dir(docs, game_folder_name)
+        if game_dir is None:
+            continue
+        p = game_dir / "live_streams.sii"
+        try:
+            os.stat(str(p))
+        except OSError:
+            continue
+        return p
     return None
 
 
@@ -86,18 +117,26 @@ def parse_live_streams(path: str):
     if not p.exists():
         raise ValueError("File does not exist.")
 
-    text = p.read_text(encoding="utf-8", errors="replace")
-    lines = text.splitlines(True)
+    data = p.read_bytes()
+    lines = data.splitlines(keepends=True)
 
     stations: list[Station] = []
     station_line_indexes: list[int] = []
+    count_line_index: Optional[int] = None
 
     for i, line in enumerate(lines):
-        m = STREAM_RE.match(line.rstrip("\n"))
+        # Most lines aren't stream_data at all; a substring test is far cheaper than the regex
+        if b"stream_data" not in line:
+            continue
+        m = STREAM_LINE_RE.match(line)
         if not m:
             continue
-        payload = m.group(2)
-        parts = payload.split("|")
+        if m.group(3) is not None:
+            if count_line_index is None:
+                count_line_index = i
+            continue
+        # Split the raw payload; only the four text fields need decoding
+        parts = m.group(2).split(b"|")
         if len(parts) != 6:
             continue
 
@@ -108,56 +147,79 @@ def parse_live_streams(path: str):
             bitrate_i = 0
 
         stations.append(Station(
-            url=url.strip(),
-            name=name.strip(),
-            genre=genre.strip(),
-            language=lang.strip(),
+            url=url.decode("utf-8", errors="replace").strip(),
+            name=name.decode("utf-8", errors="replace").strip(),
+            genre=genre.decode("utf-8", errors="replace").strip(),
+            language=lang.decode("utf-8", errors="replace").strip(),
             bitrate=bitrate_i,
-            favorite=(fav.strip() == "1")
+            favorite=(fav.strip() == b"1")
         ))
         station_line_indexes.append(i)
 
     if not stations:
         raise ValueError("No stream_data[...] station entries found in this file.")
 
-    return lines, station_line_indexes, stations
+    return lines, station_line_indexes, count_line_index, stations
+
+
+def station_to_line(i: int, s: Station, newline: bytes = b"\n") -> bytes:
+    """Fields are '|'-free by construction: parsed ones are split on '|', edited ones pass EditorPage._validate_form."""
+    fav = b"1" if s.favorite else b"0"
+    return b'stream_data[%d]: "%s|%s|%s|%s|%d|%s"%s' % (
+        i, s.url.encode("utf-8"), s.name.encode("utf-8"), s.genre.encode("utf-8"),
+        s.language.encode("utf-8"), int(s.bitrate), fav, newline
+    )
 
 
-def station_to_line(i: int, s: Station) -> str:
-    for field in (s.url, s.name, s.genre, s.language):
-        if "|" in field:
-            raise ValueError("Fields cannot contain the '|' character.")
-    fav = "1" if s.favorite else "0"
-    return f'stream_data[{i}]: "{s.url}|{s.name}|{s.genre}|{s.language}|{int(s.bitrate)}|{fav}"\n'
+def _detect_newline(lines: list[bytes]) -> bytes:
+    """Reuse the file's own line ending so CRLF files stay CRLF."""
+    for line in lines:
+        if line.endswith(b"\r\n"):
+            return b"\r\n"
+        if line.endswith(b"\n"):
+            return b"\n"
+    return b"\n"
 
 
-def _find_trailing_brace_tail_start(lines: list[str]) -> int:
+def _find_trailing_brace_tail_start(lines: list[bytes]) -> int:
     """Keep closing braces at the bottom by inserting new station lines before brace-tail."""
     i = len(lines)
     while i > 0:
         t = lines[i - 1].strip()
-        if t == "" or t == "}":
+        if t == b"" or t == b"}":
             i -= 1
             continue
         break
     return i
 
 
-def _update_stream_data_count_line(lines: list[str], count: int) -> bool:
-    """Update the 'stream_data: N' count line to match number of stations."""
+def _find_stream_data_count_line(lines: list[bytes]) -> Optional[int]:
+    """Linear scan for the 'stream_data: N' line, for callers that don't have its parsed index."""
     for i, line in enumerate(lines):
-        m = STREAM_COUNT_RE.match(line.rstrip("\n"))
-        if not m:
+        if b"stream_data" not in line or b"[" in line:
             continue
-        prefix, _old, suffix = m.groups()
-        newline = "\n" if line.endswith("\n") else ""
-        lines[i] = f"{prefix}{count}{suffix}{newline}"
-        return True
-    return False
+        if STREAM_COUNT_RE.match(line.rstrip(b"\n")):
+            return i
+    return None
+
+
+def _update_stream_data_count_line(lines: list[bytes], index: int, count: int) -> bool:
+    """Update the 'stream_data: N' count line (found during parsing) to match number of stations."""
+    line = lines[index]
+    m = STREAM_COUNT_RE.match(line.rstrip(b"\n"))
+    if not m:
+        return False
+    prefix, _old, suffix = m.groups()
+    newline = b"\n" if line.endswith(b"\n") else b""
+    lines[index] = b"%s%d%s%s" % (prefix, count, suffix, newline)
+    return True
 
 
-def write_live_streams(path: str, original_lines, station_line_indexes, stations, strategy: str = "in_place"):
+def write_live_streams(path: str, original_lines, station_line_indexes, count_line_index, stations,
+                       strategy: str = "in_place"):
     """
+    count_line_index: index of the 'stream_data: N' line from parse_live_streams
+      (None falls back to scanning for it)
     strategy:
       - "in_place": rewrite station block at same location
       - "new_slot": append clean station block before final braces block
@@ -170,43 +232,55 @@ def write_live_streams(path: str, original_lines, station_line_indexes, stations
 
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
     backup = backup_dir / f"{p.name}.bak_{ts}"
-    backup.write_text("".join(original_lines), encoding="utf-8")
+    if p.exists():
+        # The file on disk is still the pre-edit version, so copy it as-is.
+        shutil.copyfile(str(p), str(backup))
+    else:
+        with open(backup, "wb", buffering=1 << 17) as f:
+            f.writelines(original_lines)
 
-    new_station_lines = [station_to_line(i, s) for i, s in enumerate(stations)]
+    newline = _detect_newline(original_lines)
+    new_station_lines = [station_to_line(i, s, newline) for i, s in enumerate(stations)]
 
     lines = list(original_lines)
     idxs = sorted(station_line_indexes)
 
-    # Remove old station lines
-    for i in reversed(idxs):
-        del lines[i]
+    # Fix stream_data count line to match station count (before line indexes shift)
+    if count_line_index is None:
+        count_line_index = _find_stream_data_count_line(lines)
+    if count_line_index is not None:
+        _update_stream_data_count_line(lines, count_line_index, len(stations))
 
-    if strategy == "new_slot":
-        tail_start = _find_trailing_brace_tail_start(lines)
-        prefix = lines[:tail_start]
-        tail = lines[tail_start:]
+    if strategy != "new_slot" and idxs[-1] - idxs[0] + 1 == len(idxs):
+        # Station lines form one contiguous block: swap it with a single slice assignment
+        lines[idxs[0]:idxs[-1] + 1] = new_station_lines
+    else:
+        # Remove old station lines
+        idx_set = set(idxs)
+        lines = [line for i, line in enumerate(lines) if i not in idx_set]
 
-        if prefix and prefix[-1].strip() != "":
-            prefix.append("\n")
+        if strategy == "new_slot":
+            tail_start = _find_trailing_brace_tail_start(lines)
+            prefix = lines[:tail_start]
+            tail = lines[tail_start:]
 
-        station_block = list(new_station_lines)
+            if prefix and prefix[-1].strip() != b"":
+                prefix.append(newline)
 
-        # optional spacing before brace-tail
-        if tail and tail[0].strip() == "}":
-            if station_block and station_block[-1].strip() != "":
-                station_block.append("\n")
+            station_block = list(new_station_lines)
 
-        lines = prefix + station_block + tail
-    else:
-        first = idxs[0]
-        first = max(0, min(first, len(lines)))
-        for offset, line in enumerate(new_station_lines):
-            lines.insert(first + offset, line)
+            # optional spacing before brace-tail
+            if tail and tail[0].strip() == b"}":
+                if station_block and station_block[-1].strip() != b"":
+                    station_block.append(newline)
 
-    # Fix stream_data count line to match station count
-    _update_stream_data_count_line(lines, len(stations))
+            lines = prefix + station_block + tail
+        else:
+            first = idxs[0]
+            first = max(0, min(first, len(lines)))
+            lines[first:first] = new_station_lines
 
-    p.write_text("".join(lines), encoding="utf-8")
+    p.write_bytes(b"".join(lines))
     return str(backup)
 
 
@@ -263,31 +337,90 @@ def _run_cmd(command: str) -> subprocess.CompletedProcess:
     return subprocess.run(["cmd", "/c", command], capture_output=True, text=True)
 
 
+def _shell_execute_runas(exe: str, params: str) -> Tuple[Optional[int], str]:
+    """
+    Start `exe params` elevated (UAC "runas") and hidden via ShellExecuteExW, then wait for it.
+    Returns (exit_code, "") on success or (None, error_text) if it couldn't be started / was canceled.
+    """
+    import ctypes
+    from ctypes import wintypes
+
+    class SHELLEXECUTEINFOW(ctypes.Structure):
+        _fields_ = [
+            ("cbSize", wintypes.DWORD),
+            ("fMask", wintypes.ULONG),
+            ("hwnd", wintypes.HWND),
+            ("lpVerb", wintypes.LPCWSTR),
+            ("lpFile", wintypes.LPCWSTR),
+            ("lpParameters", wintypes.LPCWSTR),
+            ("lpDirectory", wintypes.LPCWSTR),
+            ("nShow", ctypes.c_int),
+            ("hInstApp", wintypes.HINSTANCE),
+            ("lpIDList", ctypes.c_void_p),
+            ("lpClass", wintypes.LPCWSTR),
+            ("hkeyClass", wintypes.HKEY),
+            ("dwHotKey", wintypes.DWORD),
+            ("hIconOrMonitor", wintypes.HANDLE),
+            ("hProcess", wintypes.HANDLE),
+        ]
+
+    SEE_MASK_NOCLOSEPROCESS = 0x00000040
+    SEE_MASK_NOASYNC = 0x00000100
+    SW_HIDE = 0
+    INFINITE = 0xFFFFFFFF
+    ERROR_CANCELLED = 1223
+
+    shell32 = ctypes.WinDLL("shell32", use_last_error=True)
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    shell32.ShellExecuteExW.argtypes = [ctypes.POINTER(SHELLEXECUTEINFOW)]
+    shell32.ShellExecuteExW.restype = wintypes.BOOL
+    kernel32.WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+    kernel32.WaitForSingleObject.restype = wintypes.DWORD
+    kernel32.GetExitCodeProcess.argtypes = [wintypes.HANDLE, ctypes.POINTER(wintypes.DWORD)]
+    kernel32.GetExitCodeProcess.restype = wintypes.BOOL
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    kernel32.CloseHandle.restype = wintypes.BOOL
+
+    sei = SHELLEXECUTEINFOW()
+    sei.cbSize = ctypes.sizeof(SHELLEXECUTEINFOW)
+    sei.fMask = SEE_MASK_NOCLOSEPROCESS | SEE_MASK_NOASYNC
+    sei.lpVerb = "runas"
+    sei.lpFile = exe
+    sei.lpParameters = params
+    sei.nShow = SW_HIDE
+
+    if not shell32.ShellExecuteExW(ctypes.byref(sei)):
+        err = ctypes.get_last_error()
+        if err == ERROR_CANCELLED:
+            return None, "The UAC prompt was canceled."
+        return None, ctypes.FormatError(err)
+
+    if not sei.hProcess:
+        return None, "Elevated process handle was not returned."
+
+    try:
+        kernel32.WaitForSingleObject(sei.hProcess, INFINITE)
+        code = wintypes.DWORD(0)
+        if not kernel32.GetExitCodeProcess(sei.hProcess, ctypes.byref(code)):
+            return None, ctypes.FormatError(ctypes.get_last_error())
+        return int(code.value), ""
+    finally:
+        kernel32.CloseHandle(sei.hProcess)
+
+
 def _mklink_symlink_admin(dest: Path, src: Path) -> Tuple[bool, str]:
     """
-    Force file symlink via UAC elevation using a temp .cmd and capturing output to a temp log.
+    Force file symlink via UAC elevation: one elevated cmd.exe runs mklink directly
+    (no PowerShell / temp .cmd hop), capturing output to a temp log.
     This avoids the 'needs admin' problem for symlink creation.
     """
     temp_dir = Path(os.environ.get("TEMP", str(Path.home())))
     ts = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-    cmd_file = temp_dir / f"radio_link_{ts}.cmd"
     log_file = temp_dir / f"radio_link_{ts}.log"
 
     mk_cmd = f'mklink "{dest}" "{src}"'  # FILE symlink (no /D, no /H)
 
-    cmd_contents = (
-        "@echo off\n"
-        f'{mk_cmd} > "{log_file}" 2>&1\n'
-        "exit /b %errorlevel%\n"
-    )
-    cmd_file.write_text(cmd_contents, encoding="utf-8")
-
-    ps = f'Start-Process -FilePath "{cmd_file}" -Verb RunAs -WindowStyle Hidden -Wait'
-    r = subprocess.run(
-        ["powershell", "-NoProfile", "-ExecutionPolicy", "Bypass", "-Command", ps],
-        capture_output=True,
-        text=True
-    )
+    code, err = _shell_execute_runas("cmd.exe", f'/c {mk_cmd} > "{log_file}" 2>&1')
 
     output = ""
     if log_file.exists():
@@ -296,25 +429,17 @@ def _mklink_symlink_admin(dest: Path, src: Path) -> Tuple[bool, str]:
         except Exception:
             output = ""
 
-    # cleanup cmd (keep log for debugging if you want)
-    try:
-        cmd_file.unlink(missing_ok=True)  # type: ignore[arg-type]
-    except Exception:
-        try:
-            if cmd_file.exists():
-                cmd_file.unlink()
-        except Exception:
-            pass
-
     # verify
     if dest.exists() or dest.is_symlink():
         return True, output or "mklink completed."
 
-    extra = (r.stderr or r.stdout or "").strip()
-    if extra and output:
-        output = output + "\n\n" + extra
-    elif extra and not output:
-        output = extra
+    if not err and code and not output:
+        err = f"mklink exited with code {code}."
+
+    if err and output:
+        output = output + "\n\n" + err
+    elif err and not output:
+        output = err
 
     return False, output or "mklink failed or was canceled."
 
@@ -375,12 +500,117 @@ HEADERS = ["★", "Name", "Genre", "Language", "Bitrate", "URL"]
 MIME_ROWS = "application/x-radioeditor-rows"
 
 
+class StationColumns:
+    """
+    Column-oriented station storage: one parallel sequence per field, so sort/filter
+    lookups index a single column. Indexing returns a Station snapshot (not a live view);
+    write changes back with item assignment or set_favorite().
+    """
+
+    def __init__(self, stations=()):
+        self.urls: list[str] = []
+        self.names: list[str] = []
+        self.genres: list[str] = []
+        self.languages: list[str] = []
+        # Plain ints: the file may hold any integer bitrate, so no fixed-width array
+        self.bitrates: list[int] = []
+        self.favorites = bytearray()
+
+        # Lowercased sort keys, kept in step with the text columns
+        self.urls_lc: list[str] = []
+        self.names_lc: list[str] = []
+        self.genres_lc: list[str] = []
+        self.languages_lc: list[str] = []
+
+        for s in stations:
+            self.append(s)
+
+    def _list_columns(self) -> tuple[list, ...]:
+        return (
+            self.urls, self.names, self.genres, self.languages, self.bitrates,
+            self.urls_lc, self.names_lc, self.genres_lc, self.languages_lc,
+        )
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, row: int) -> Station:
+        return Station(
+            url=self.urls[row],
+            name=self.names[row],
+            genre=self.genres[row],
+            language=self.languages[row],
+            bitrate=self.bitrates[row],
+            favorite=bool(self.favorites[row])
+        )
+
+    def __setitem__(self, row: int, s: Station):
+        self.urls[row] = s.url
+        self.names[row] = s.name
+        self.genres[row] = s.genre
+        self.languages[row] = s.language
+        self.bitrates[row] = int(s.bitrate)
+        self.favorites[row] = 1 if s.favorite else 0
+        self.urls_lc[row] = s.url.lower()
+        self.names_lc[row] = s.name.lower()
+        self.genres_lc[row] = s.genre.lower()
+        self.languages_lc[row] = s.language.lower()
+
+    def __iter__(self):
+        for row in range(len(self)):
+            yield self[row]
+
+    def append(self, s: Station):
+        self.urls.append(s.url)
+        self.names.append(s.name)
+        self.genres.append(s.genre)
+        self.languages.append(s.language)
+        self.bitrates.append(int(s.bitrate))
+        self.favorites.append(1 if s.favorite else 0)
+        self.urls_lc.append(s.url.lower())
+        self.names_lc.append(s.name.lower())
+        self.genres_lc.append(s.genre.lower())
+        self.languages_lc.append(s.language.lower())
+
+    def set_favorite(self, row: int, on: bool):
+        self.favorites[row] = 1 if on else 0
+
+    def delete(self, row: int, count: int):
+        for col in self._list_columns():
+            del col[row: row + count]
+        del self.favorites[row: row + count]
+
+    def reorder(self, order: list[int]):
+        """Rearrange every column so that new row i holds old row order[i]."""
+        for col in self._list_columns():
+            col[:] = [col[i] for i in order]
+        self.favorites = bytearray(self.favorites[i] for i in order)
+
+
 class StationModel(QAbstractTableModel):
     reordered = Signal()
 
+    # Per-column accessors indexed by COL_*: sort keys (Qt.UserRole) and display values
+    _SORT_KEYS = (
+        lambda cols, r: cols.favorites[r],
+        lambda cols, r: cols.names_lc[r],
+        lambda cols, r: cols.genres_lc[r],
+        lambda cols, r: cols.languages_lc[r],
+        lambda cols, r: cols.bitrates[r],
+        lambda cols, r: cols.urls_lc[r],
+    )
+    _DISPLAY = (
+        lambda cols, r: "★" if cols.favorites[r] else "☆",
+        lambda cols, r: cols.names[r],
+        lambda cols, r: cols.genres[r],
+        lambda cols, r: cols.languages[r],
+        lambda cols, r: cols.bitrates[r],
+        lambda cols, r: cols.urls[r],
+    )
+
     def __init__(self, stations=None):
         super().__init__()
-        self.stations: list[Station] = stations or []
+        self.stations = StationColumns(stations or ())
         self.drag_enabled = False
 
     def rowCount(self, parent=QModelIndex()):
@@ -399,36 +629,11 @@ class StationModel(QAbstractTableModel):
     def data(self, index, role=Qt.DisplayRole):
         if not index.isValid():
             return None
-        s = self.stations[index.row()]
-        c = index.column()
-
         if role == Qt.UserRole:
-            if c == COL_FAV:
-                return 1 if s.favorite else 0
-            if c == COL_NAME:
-                return s.name.lower()
-            if c == COL_GENRE:
-                return s.genre.lower()
-            if c == COL_LANG:
-                return s.language.lower()
-            if c == COL_BITRATE:
-                return int(s.bitrate)
-            if c == COL_URL:
-                return s.url.lower()
+            return self._SORT_KEYS[index.column()](self.stations, index.row())
 
         if role in (Qt.DisplayRole, Qt.EditRole):
-            if c == COL_FAV:
-                return "★" if s.favorite else "☆"
-            if c == COL_NAME:
-                return s.name
-            if c == COL_GENRE:
-                return s.genre
-            if c == COL_LANG:
-                return s.language
-            if c == COL_BITRATE:
-                return s.bitrate
-            if c == COL_URL:
-                return s.url
+            return self._DISPLAY[index.column()](self.stations, index.row())
 
         return None
 
@@ -446,7 +651,7 @@ class StationModel(QAbstractTableModel):
         if row < 0 or count <= 0 or row + count > len(self.stations):
             return False
         self.beginRemoveRows(parent, row, row + count - 1)
-        del self.stations[row: row + count]
+        self.stations.delete(row, count)
         self.endRemoveRows()
         return True
 
@@ -502,14 +707,13 @@ class StationModel(QAbstractTableModel):
         dst_adj = max(0, dst - removed_before_dst)
 
         src_set = set(src_rows)
-        dragged = [s for i, s in enumerate(self.stations) if i in src_set]
-        remaining = [s for i, s in enumerate(self.stations) if i not in src_set]
+        remaining = [i for i in range(len(self.stations)) if i not in src_set]
 
         dst_adj = min(dst_adj, len(remaining))
-        new_list = remaining[:dst_adj] + dragged + remaining[dst_adj:]
+        order = remaining[:dst_adj] + src_rows + remaining[dst_adj:]
 
         self.beginResetModel()
-        self.stations = new_list
+        self.stations.reorder(order)
         self.endResetModel()
 
         self.reordered.emit()
@@ -547,6 +751,20 @@ class GlobalClickClearSelectionFilter(QObject):
                     gp = event.globalPos()
                 except Exception:
                     return False
+            t = self.editor_page.table
+            # Cheap geometry check first, but only for presses on the table's own window (both the
+            # QWindow-level delivery and the widget one) with no popup open; dialogs/menus over the
+            # table still go through widgetAt
+            top = t.window()
+            on_table_window = obj is top.windowHandle() or (
+                isinstance(obj, QWidget) and obj.window() is top
+            )
+            if (
+                on_table_window
+                and QApplication.activePopupWidget() is None
+                and t.isVisible() and t.rect().contains(t.mapFromGlobal(gp))
+            ):
+                return False
             w = QApplication.widgetAt(gp)
             if not self._is_inside_table(w):
                 self.editor_page.table.clearSelection()
@@ -564,6 +782,7 @@ class GameTile(QWidget):
         self.setCursor(QCursor(Qt.PointingHandCursor))
         self._w = width_px
         self._h = height_px
+        self._current_key: Optional[int] = None
 
         lay = QVBoxLayout(self)
         lay.setContentsMargins(8, 8, 8, 8)
@@ -585,9 +804,16 @@ class GameTile(QWidget):
         lay.addWidget(self.caption, 0, Qt.AlignCenter)
         lay.addWidget(self.subcaption, 0, Qt.AlignCenter)
 
+    def scale_pixmap(self, pix: QPixmap) -> QPixmap:
+        return pix.scaled(self._w, self._h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
     def set_pixmap(self, pix: QPixmap):
-        scaled = pix.scaled(self._w, self._h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        self.img.setPixmap(scaled)
+        """Show a pixmap already sized with scale_pixmap(); no-op if it's the one shown."""
+        key = pix.cacheKey()
+        if key == self._current_key:
+            return
+        self._current_key = key
+        self.img.setPixmap(pix)
 
     def set_customized_label(self, on: bool):
         self.subcaption.setText("(Customized)" if on else "")
@@ -606,6 +832,12 @@ class OpenPage(QWidget):
         self.on_open_callback = on_open_callback
         self.settings = settings
 
+        # Manual associations mirrored from settings so refreshes don't hit the settings backend
+        self._manual = {
+            "ATS": str(settings.value("manual_ats_path", "") or "").strip(),
+            "ETS2": str(settings.value("manual_ets2_path", "") or "").strip(),
+        }
+
         self.ats_path: Optional[Path] = None
         self.ets2_path: Optional[Path] = None
 
@@ -633,6 +865,12 @@ class OpenPage(QWidget):
         self.tile_ats = GameTile("American Truck Simulator", width_px=172, height_px=400)
         self.tile_ets2 = GameTile("Euro Truck Simulator 2", width_px=216, height_px=400)
 
+        # Decode and scale the tile images once; refresh_game_tiles just swaps between them
+        self._pix_ats_active = self.tile_ats.scale_pixmap(QPixmap(resource_path("ATS_active.png")))
+        self._pix_ats_inactive = self.tile_ats.scale_pixmap(QPixmap(resource_path("ATS_inactive.png")))
+        self._pix_ets2_active = self.tile_ets2.scale_pixmap(QPixmap(resource_path("ETS2_active.png")))
+        self._pix_ets2_inactive = self.tile_ets2.scale_pixmap(QPixmap(resource_path("ETS2_inactive.png")))
+
         self.tile_ats.clicked.connect(self.open_ats)
         self.tile_ets2.clicked.connect(self.open_ets2)
 
@@ -684,17 +922,20 @@ class OpenPage(QWidget):
 
     def set_manual_game_file(self, game: str, path: str):
         self.settings.setValue("manual_ats_path" if game == "ATS" else "manual_ets2_path", path)
+        self._manual["ATS" if game == "ATS" else "ETS2"] = str(path).strip()
 
     def clear_manual_game_file(self, game: str):
         self.settings.setValue("manual_ats_path" if game == "ATS" else "manual_ets2_path", "")
+        self._manual["ATS" if game == "ATS" else "ETS2"] = ""
 
     def clear_all_manual_game_files(self):
         self.settings.setValue("manual_ats_path", "")
         self.settings.setValue("manual_ets2_path", "")
+        self._manual["ATS"] = ""
+        self._manual["ETS2"] = ""
 
     def get_manual_game_file(self, game: str) -> Optional[Path]:
-        key = "manual_ats_path" if game == "ATS" else "manual_ets2_path"
-        val = str(self.settings.value(key, "") or "").strip()
+        val = self._manual["ATS" if game == "ATS" else "ETS2"]
         if not val:
             return None
         p = Path(val)
@@ -742,7 +983,7 @@ class OpenPage(QWidget):
         game = "ATS" if mb.clickedButton() == btn_ats else "ETS2"
 
         try:
-            parse_live_streams(path)
+            parsed = parse_live_streams(path)
         except Exception as e:
             QMessageBox.warning(self, "Invalid file", f"That file can't be used:\n\n{e}")
             return
@@ -752,7 +993,8 @@ class OpenPage(QWidget):
         self.refresh_game_tiles()
 
         try:
-            self.on_open_callback(path)
+            # Hand over the validation parse so the editor doesn't read the file again
+            self.on_open_callback(path, parsed)
         except Exception as e:
             self.error_label.setText(str(e))
 
@@ -779,26 +1021,21 @@ class OpenPage(QWidget):
         self.ats_path = manual_ats or auto_ats
         self.ets2_path = manual_ets2 or auto_ets2
 
-        ats_active = QPixmap(resource_path("ATS_active.png"))
-        ats_inactive = QPixmap(resource_path("ATS_inactive.png"))
-        ets2_active = QPixmap(resource_path("ETS2_active.png"))
-        ets2_inactive = QPixmap(resource_path("ETS2_inactive.png"))
-
         if self.ats_path:
-            self.tile_ats.set_pixmap(ats_active)
+            self.tile_ats.set_pixmap(self._pix_ats_active)
             self.tile_ats.set_customized_label(bool(manual_ats))
             self.tile_ats.setToolTip(str(self.ats_path))
         else:
-            self.tile_ats.set_pixmap(ats_inactive)
+            self.tile_ats.set_pixmap(self._pix_ats_inactive)
             self.tile_ats.set_customized_label(False)
             self.tile_ats.setToolTip("ATS live_streams.sii not found / not chosen")
 
         if self.ets2_path:
-            self.tile_ets2.set_pixmap(ets2_active)
+            self.tile_ets2.set_pixmap(self._pix_ets2_active)
             self.tile_ets2.set_customized_label(bool(manual_ets2))
             self.tile_ets2.setToolTip(str(self.ets2_path))
         else:
-            self.tile_ets2.set_pixmap(ets2_inactive)
+            self.tile_ets2.set_pixmap(self._pix_ets2_inactive)
             self.tile_ets2.set_customized_label(False)
             self.tile_ets2.setToolTip("ETS2 live_streams.sii not found / not chosen")
 
@@ -825,8 +1062,8 @@ class OpenPage(QWidget):
     def _default_dest_path_for_game(self, game: str) -> Optional[Path]:
         folder = "American Truck Simulator" if game == "ATS" else "Euro Truck Simulator 2"
         for docs in _candidate_documents_dirs():
-            game_dir = docs / folder
-            if game_dir.exists():
+            game_dir = _find_game_dir(docs, folder)
+            if game_dir is not None:
                 return game_dir / "live_streams.sii"
         return None
 
@@ -895,9 +1132,11 @@ class OpenPage(QWidget):
             return
 
         try:
-            _, _, src_stations = parse_live_streams(str(src_path))
-            dst_lines, dst_idxs, _ = parse_live_streams(str(dst_path))
-            backup = write_live_streams(str(dst_path), dst_lines, dst_idxs, src_stations, strategy="in_place")
+            _, _, _, src_stations = parse_live_streams(str(src_path))
+            dst_lines, dst_idxs, dst_count_idx, _ = parse_live_streams(str(dst_path))
+            backup = write_live_streams(
+                str(dst_path), dst_lines, dst_idxs, dst_count_idx, src_stations, strategy="in_place"
+            )
 
             mw = self.window()
             if isinstance(mw, QMainWindow):
@@ -918,6 +1157,7 @@ class EditorPage(QWidget):
         self.file_path: Optional[str] = None
         self.original_lines = None
         self.station_line_indexes = None
+        self.count_line_index: Optional[int] = None
         self._suppress_reorder_autosave = False
 
         self.model = StationModel([])
@@ -1091,16 +1331,18 @@ class EditorPage(QWidget):
             and not self.in_fav.isChecked()
         )
 
-    def load_file(self, path: str):
+    def load_file(self, path: str, parsed=None):
+        """parsed: an existing parse_live_streams(path) result to reuse instead of re-reading the file."""
         self._suppress_reorder_autosave = True
         try:
-            lines, idxs, stations = parse_live_streams(path)
+            lines, idxs, count_idx, stations = parsed if parsed is not None else parse_live_streams(path)
             self.file_path = path
             self.original_lines = lines
             self.station_line_indexes = idxs
+            self.count_line_index = count_idx
 
             self.model.beginResetModel()
-            self.model.stations = stations
+            self.model.stations = StationColumns(stations)
             self.model.endResetModel()
 
             self.lbl_file.setText(f"File: {path}")
@@ -1165,7 +1407,7 @@ class EditorPage(QWidget):
             return
 
         # Toggle favorite
-        self.model.stations[src_row].favorite = not self.model.stations[src_row].favorite
+        self.model.stations.set_favorite(src_row, not self.model.stations.favorites[src_row])
         tl = self.model.index(src_row, COL_FAV)
         br = self.model.index(src_row, COL_FAV)
         self.model.dataChanged.emit(tl, br, [Qt.DisplayRole, Qt.UserRole])
@@ -1235,8 +1477,8 @@ class EditorPage(QWidget):
             changed_any = False
             for r in src_rows:
                 if 0 <= r < len(self.model.stations):
-                    if self.model.stations[r].favorite != new_val:
-                        self.model.stations[r].favorite = new_val
+                    if bool(self.model.stations.favorites[r]) != new_val:
+                        self.model.stations.set_favorite(r, new_val)
                         changed_any = True
                         tl = self.model.index(r, COL_FAV)
                         br = self.model.index(r, COL_FAV)
@@ -1349,13 +1591,15 @@ class EditorPage(QWidget):
                 self.file_path,
                 self.original_lines,
                 self.station_line_indexes,
+                self.count_line_index,
                 self.model.stations,
                 strategy=strategy_override
             )
 
-            fresh_lines, fresh_idxs, _ = parse_live_streams(self.file_path)
+            fresh_lines, fresh_idxs, fresh_count_idx, _ = parse_live_streams(self.file_path)
             self.original_lines = fresh_lines
             self.station_line_indexes = fresh_idxs
+            self.count_line_index = fresh_count_idx
 
             if reload_ui:
                 self.load_file(self.file_path)
@@ -1440,8 +1684,8 @@ class MainWindow(QMainWindow):
         self.stack.setCurrentWidget(self.open_page)
         self.open_page.refresh_game_tiles()
 
-    def open_file(self, path: str):
-        self.editor_page.load_file(path)
+    def open_file(self, path: str, parsed=None):
+        self.editor_page.load_file(path, parsed)
         self.stack.setCurrentWidget(self.editor_page)
         self.statusBar().showMessage(f"Loaded {len(self.editor_page.model.stations)} stations.", 5000)
 